@@ -1,4 +1,3 @@
-import tensorflow as tf 
 import keras
 
 
@@ -38,7 +37,7 @@ class Attention(keras.layers.Layer):
     def call(self, inputs, mask=None):
 
         if mask is not None:
-            padding_mask = tf.cast(mask[:, None, :], dtype='int32')
+            padding_mask = mask[:, None, :]
         else:
             padding_mask = None
 
@@ -98,7 +97,7 @@ class CrossAttention(Attention):
     def call(self, inputs, encoder_outputs, mask=None):
 
         if mask is not None:
-            padding_mask = tf.cast(mask[:, None, :], dtype='int32')
+            padding_mask = mask[:, None, :]
         else:
             padding_mask = None
             
@@ -27,6 +27,7 @@ class SequenceEmbedding(keras.layers.Layer):
         else:
             self.positional_embedding = SineCosinePositionalEncoding(
                 output_dim=embedding_dim,
+                sequence_length=sequence_length,
             )
 
         self.learnable_positional_embedding = learnable_positional_embedding
@@ -55,16 +56,36 @@ class SineCosinePositionalEncoding(keras.layers.Layer):
         self,
         output_dim: int,
         max_wavelength:int = 10000,
+        sequence_length: int = None,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.output_dim = output_dim
         self.max_wavelength = max_wavelength
+        self.sequence_length = sequence_length
+        # Encodings are input independent, hence (if `sequence_length` is 
+        # specified) precomputed once and looked up in `call`.
+        if self.sequence_length is not None:
+            self.positional_encodings = self._compute_positional_encodings(
+                ops.arange(self.sequence_length)
+            )
+        else:
+            self.positional_encodings = None
         self.built = True
 
     def call(self, positions: tf.Tensor) -> tf.Tensor:
-        seq_length = ops.shape(positions)[0]
-        positions = ops.arange(seq_length)
+        # Only the number of positions is used (positions 0, 1, ..., n-1)
+        length = ops.shape(positions)[0]
+        if self.positional_encodings is None:
+            return self._compute_positional_encodings(ops.arange(length))
+        # Inputs longer than `sequence_length` are computed on the fly
+        return ops.cond(
+            length <= self.sequence_length,
+            lambda: self.positional_encodings[:length],
+            lambda: self._compute_positional_encodings(ops.arange(length)),
+        )
+
+    def _compute_positional_encodings(self, positions: tf.Tensor) -> tf.Tensor:
         positions = ops.cast(positions, self.compute_dtype)
         min_freq = ops.cast(1 / self.max_wavelength, dtype=self.compute_dtype)
         timescales = ops.power(
@@ -78,4 +99,4 @@ class SineCosinePositionalEncoding(keras.layers.Layer):
         positional_encodings = (
             ops.sin(angles) * sin_mask + ops.cos(angles) * cos_mask
         )
-        return positional_encodings
\ No newline at end of file
+        return positional_encodings
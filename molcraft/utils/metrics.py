@@ -1,17 +1,16 @@
 import numpy as np
 
+from concurrent.futures import ProcessPoolExecutor
+
 from rdkit import Chem
 from rdkit.Chem import QED
 from rdkit.Contrib.SA_Score import sascorer
 
 # TODO: Create a Callback which computes these metrics?
 
-def validity(smiles: list[str]) -> float:
+def validity(smiles: list[str], num_workers: int = 1) -> float:
     n_total = len(smiles)
-    n_valid = 0
-    for s in smiles:
-        if Chem.MolFromSmiles(s) is not None:
-            n_valid += 1 
+    n_valid = sum(_map(_is_valid, smiles, num_workers))
     return n_valid / n_total
 
 def diversity(smiles: list[str]) -> float:
@@ -19,37 +18,50 @@ def diversity(smiles: list[str]) -> float:
     n_unique = len(set(smiles))
     return n_unique / n_total
 
-def novelty(smiles: list[str], smiles_database: list[str]) -> float:
+def novelty(
+    smiles: list[str], 
+    smiles_database: list[str] | set[str]
+) -> float:
+    # Pass `smiles_database` as a set to reuse it across evaluations
     n_total = len(smiles)
-    n_novel = len(set(smiles) - set(smiles_database))
+    n_novel = len(set(smiles).difference(smiles_database))
     return n_novel / n_total
 
-def qed(smiles: list[str]) -> tuple[float, float]:
-    qed_scores = []
-    for s in smiles:
-        mol = Chem.MolFromSmiles(s)
-        if mol is not None:
-            qed_score = QED.qed(mol)
-            qed_scores.append(qed_score)
-
-    if not len(qed_scores):
-        return None 
-        
-    qed_mean = np.mean(qed_scores)
-    qed_stderr = np.std(qed_scores) / np.sqrt(len(qed_scores))
-    return qed_mean, qed_stderr
-
-def sas(smiles: list[str]) -> tuple[float, float]:
-    sas_scores = []
-    for s in smiles:
-        mol = Chem.MolFromSmiles(s)
-        if mol is not None:
-            sas_score = sascorer.calculateScore(mol)
-            sas_scores.append(sas_score)
-    
-    if not len(sas_scores):
-        return None 
-        
-    sas_mean = np.mean(sas_scores)
-    sas_stderr = np.std(sas_scores) / np.sqrt(len(sas_scores))
-    return sas_mean, sas_stderr
\ No newline at end of file
+def qed(smiles: list[str], num_workers: int = 1) -> tuple[float, float]:
+    return _mean_and_stderr(_map(_qed_score, smiles, num_workers))
+
+def sas(smiles: list[str], num_workers: int = 1) -> tuple[float, float]:
+    return _mean_and_stderr(_map(_sas_score, smiles, num_workers))
+
+def _map(fn, smiles: list[str], num_workers: int) -> list:
+    if num_workers <= 1:
+        return list(map(fn, smiles))
+    chunksize = max(1, len(smiles) // (num_workers * 4))
+    with ProcessPoolExecutor(num_workers) as executor:
+        return list(executor.map(fn, smiles, chunksize=chunksize))
+
+def _mean_and_stderr(scores: list[float]) -> tuple[float, float]:
+    scores = np.fromiter(
+        (score for score in scores if score is not None), dtype='float64')
+
+    if not scores.size:
+        return None
+
+    mean = scores.mean()
+    stderr = scores.std() / np.sqrt(scores.size)
+    return mean, stderr
+
+def _is_valid(smiles: str) -> bool:
+    return Chem.MolFromSmiles(smiles) is not None
+
+def _qed_score(smiles: str) -> float:
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        return None
+    return QED.qed(mol)
+
+def _sas_score(smiles: str) -> float:
+    mol = Chem.MolFromSmiles(smiles)
+    if mol is None:
+        return None
+    return sascorer.calculateScore(mol)
@@ -26,6 +26,7 @@ class Sampler(tf.Module):
         self._model = model
         self._tokenizer = tokenizer 
         self._temperature = temperature
+        self._inv_temperature = 1.0 / temperature
         self._top_k = top_k
         self._pad_token_id = self._tokenizer._mask_token_id
         self._eos_token_id = self._tokenizer._eos_token_id
@@ -45,42 +46,53 @@ class Sampler(tf.Module):
             input_sequences
         )
         
-        pad_tokens = tf.where(input_sequences == self._pad_token_id)[:, 0]
-
-        target_positions = (
-            self._max_sequence_length 
-            - tf.math.bincount(pad_tokens)
-            - 1
+        pad_counts = tf.reduce_sum(
+            tf.cast(input_sequences == self._pad_token_id, tf.int32), 
+            axis=1
         )
-        batch_size = keras.ops.shape(input_sequences)[0]
+
+        target_positions = self._max_sequence_length - pad_counts - 1
+
+        def is_active(
+            last_token: tf.Tensor, 
+            indices: tf.Tensor
+        ) -> tf.Tensor:
+            return tf.logical_and(
+                (indices + 1) < self._max_sequence_length,
+                last_token != self._eos_token_id
+            )
 
         def cond(
             sequences: tf.Tensor, 
-            indices: tf.Tensor
+            indices: tf.Tensor,
+            active: tf.Tensor,
+            all_finished: tf.Tensor,
         ) -> bool:
-            last_token = tf.gather(sequences, indices, batch_dims=1)
-            return tf.reduce_any(
-                tf.logical_and(
-                    (indices + 1) < self._max_sequence_length,
-                    last_token != self._eos_token_id
-                )
-            )
+            return tf.logical_not(all_finished)
 
         def body(
             sequences: tf.Tensor, 
-            indices: tf.Tensor
-        ) -> tuple[tf.Tensor, tf.Tensor]:
-            
-            last_token = tf.gather(sequences, indices, batch_dims=1)
+            indices: tf.Tensor,
+            active: tf.Tensor,
+            all_finished: tf.Tensor,
+        ) -> tuple[tf.Tensor, tf.Tensor, tf.Tensor, tf.Tensor]:
+
+            # Only unfinished sequences are passed through the model
+            active_rows = tf.cast(tf.where(active)[:, 0], indices.dtype)
+            active_indices = tf.gather(indices, active_rows)
 
-            logits = tf.gather(self._model(sequences), indices, batch_dims=1)
+            logits = tf.gather(
+                self._model(tf.gather(sequences, active_rows)), 
+                active_indices, 
+                batch_dims=1
+            )
     
             if self._top_k:
                 logits, top_k_indices = ops.top_k(
                     logits, k=self._top_k, sorted=False)
             
             sampled_token = tf.random.categorical(
-                logits=ops.log_softmax(logits / self._temperature),
+                logits=logits * self._inv_temperature,
                 num_samples=1,
                 dtype=self._id_dtype
             )
@@ -89,29 +101,38 @@ class Sampler(tf.Module):
                 sampled_token = ops.take_along_axis(
                     top_k_indices, sampled_token, axis=-1)
     
-            indices_nd = tf.stack([tf.range(batch_size), indices + 1], axis=1)
+            indices_nd = tf.stack([active_rows, active_indices + 1], axis=1)
             updates = tf.squeeze(sampled_token, 1)
-
-            mask = tf.logical_and(
-                indices < self._max_sequence_length,
-                last_token != self._eos_token_id
-            )
-            updates = tf.boolean_mask(updates, mask)
-            indices_nd = tf.boolean_mask(indices_nd, mask)
     
             sequences = tf.tensor_scatter_nd_update(
                 sequences, indices_nd, updates
             )
             indices = tf.tensor_scatter_nd_add(
-                indices, indices_nd[:, :1], tf.ones_like(indices_nd[:, 0])
+                indices, active_rows[:, None], tf.ones_like(active_rows)
+            )
+            active = tf.tensor_scatter_nd_update(
+                active, 
+                active_rows[:, None], 
+                is_active(updates, active_indices + 1)
             )
+            all_finished = tf.logical_not(tf.reduce_any(active))
             
-            return sequences, indices
+            return sequences, indices, active, all_finished
         
-        sequences, _ = tf.while_loop(
+        active = is_active(
+            tf.gather(input_sequences, target_positions, batch_dims=1),
+            target_positions
+        )
+
+        sequences, *_ = tf.while_loop(
             cond=cond,
             body=body,
-            loop_vars=[input_sequences, target_positions]
+            loop_vars=[
+                input_sequences, 
+                target_positions, 
+                active, 
+                tf.logical_not(tf.reduce_any(active))
+            ]
         )
     
         return self._tokenizer.detokenize(sequences)
@@ -123,6 +144,7 @@ class Sampler(tf.Module):
     @temperature.setter
     def temperature(self, value):
         self._temperature = value
+        self._inv_temperature = 1.0 / value
 
     @property
     def top_k(self):
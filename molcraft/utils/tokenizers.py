@@ -44,7 +44,6 @@ class SMILESTokenizer(keras.layers.Layer):
         self._unk_token_id = 1
         self._bos_token_id = 2
         self._eos_token_id = 3
-        self._unk_token_regex = re.escape(self._unk_token)
         self._pattern_remove = '|'.join([
             re.escape(self._mask_token), 
             re.escape(self._bos_token), 
@@ -53,7 +52,10 @@ class SMILESTokenizer(keras.layers.Layer):
         self._vocabulary_size = None 
         self._adapt_eagerly = adapt_eagerly
         if not self._adapt_eagerly:
-            self._adapt_fn = tf.function(self._adapt_fn)
+            self._adapt_fn = tf.function(
+                self._adapt_fn, 
+                input_signature=[tf.TensorSpec([None], self._key_dtype)]
+            )
 
         self._build()
 
@@ -69,6 +71,20 @@ class SMILESTokenizer(keras.layers.Layer):
         return self._vectorize_tokens(tokens)
     
     def detokenize(self, tokens: tf.Tensor) -> tf.Tensor:
+        if isinstance(tokens, tf.RaggedTensor):
+            ids = tokens.flat_values
+        else:
+            tokens = tf.convert_to_tensor(tokens, dtype=self._value_dtype)
+            ids = tokens
+        # Ids outside the vocabulary are also decoded as the unknown token
+        if tf.reduce_any(
+            (ids == self._unk_token_id)
+            | (ids < 0)
+            | (ids >= self._vocabulary_size)
+        ):
+            warnings.warn(
+                f'Unknown token {self._unk_token!r} found in decoded SMILES.'
+            )
         tokens = self._lookup_table_reverse.lookup(tokens)
         return self._join_tokens(tokens)
 
@@ -83,7 +99,11 @@ class SMILESTokenizer(keras.layers.Layer):
             default_value=0
         )
         
-        ds = tf.data.Dataset.from_tensor_slices(data).batch(batch_size)
+        ds = (
+            tf.data.Dataset.from_tensor_slices(data)
+            .batch(batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
 
         total = len(data)
         
@@ -136,15 +156,8 @@ class SMILESTokenizer(keras.layers.Layer):
         self._construct_lookup_tables()
         
     def _prepare_smiles(self, smiles: tf.Tensor) -> tf.Tensor:
-        batch_size = ops.shape(smiles)[0]
-        return tf.strings.reduce_join(
-            tf.stack([
-                tf.repeat([self._bos_token], [batch_size]), 
-                smiles, 
-                tf.repeat([self._eos_token], [batch_size])
-            ]), 
-            axis=0
-        )
+        # Scalar BOS/EOS tokens are broadcast to the batch by `join`
+        return tf.strings.join([self._bos_token, smiles, self._eos_token])
 
     def _tokenize_smiles(self, smiles: tf.Tensor) -> tf.RaggedTensor:
         return tf_text.regex_split(
@@ -160,14 +173,6 @@ class SMILESTokenizer(keras.layers.Layer):
     
     def _join_tokens(self, tokens: tf.Tensor) -> tf.Tensor:
         smiles = tf.strings.reduce_join(tokens, axis=-1)
-        if tf.reduce_any(
-            tf.strings.regex_full_match(
-                smiles, '.*' + self._unk_token_regex + '.*'
-            )
-        ):
-            warnings.warn(
-                f'Unknown token {self._unk_token!r} found in decoded SMILES.'
-            )
         return tf.strings.regex_replace(
             smiles, self._pattern_remove, '')
     
@@ -177,8 +182,9 @@ class SMILESTokenizer(keras.layers.Layer):
             tokens = self._vocab
         else:
             tokens, counts = self._export_adapted_table()
-            sorted_indices = np.lexsort((tokens.numpy(), counts.numpy()))[::-1]
-            tokens = tf.gather(tokens, sorted_indices)
+            sorted_indices = np.lexsort((tokens, counts))[::-1]
+            tokens = tf.convert_to_tensor(
+                tokens[sorted_indices], dtype=self._key_dtype)
             self._vocab = tokens
 
         tokens = tf.concat([
@@ -214,18 +220,19 @@ class SMILESTokenizer(keras.layers.Layer):
 
         self._built = True
 
-    def _export_adapted_table(self) -> tuple[tf.Tensor, tf.Tensor]:
-        self._adapt_table.remove(
-            tf.convert_to_tensor([
-                self._mask_token, 
-                self._bos_token, 
-                self._eos_token, 
-                self._unk_token, 
-            ])
-        )
+    def _export_adapted_table(self) -> tuple[np.ndarray, np.ndarray]:
         tokens, counts = self._adapt_table.export()
-        self._adapt_table.remove(tokens)
-        return tokens, counts 
+        tokens, counts = tokens.numpy(), counts.numpy()
+        # The table is rebuilt on every `adapt` call, hence released here
+        self._adapt_table = None
+        special_tokens = np.array([
+            self._mask_token.encode(), 
+            self._bos_token.encode(), 
+            self._eos_token.encode(), 
+            self._unk_token.encode(), 
+        ], dtype=object)
+        keep = ~np.isin(tokens, special_tokens)
+        return tokens[keep], counts[keep]
     
     def get_config(self) -> dict:
         config = super().get_config()
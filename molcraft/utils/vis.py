@@ -1,3 +1,5 @@
+import itertools
+
 from rdkit import Chem
 from rdkit.Chem import Draw 
 
@@ -7,15 +9,13 @@ def visualize_smiles(
     grid_size: tuple[int, int] = (5, 5), 
     save_path: str = None
 ) -> None:
-    rdkit_mols = []
-    for s in smiles:
-        rdkit_mol = Chem.MolFromSmiles(s)
-        if rdkit_mol is not None:
-            rdkit_mols.append(rdkit_mol)
-
     n = grid_size[0] * grid_size[1]
+    # Stop parsing once enough valid molecules are found to fill the grid
+    rdkit_mols = (Chem.MolFromSmiles(s) for s in smiles)
+    rdkit_mols = itertools.islice(
+        (mol for mol in rdkit_mols if mol is not None), n)
     img = Draw.MolsToGridImage(
-        rdkit_mols[:n], molsPerRow=grid_size[0], returnPNG=False)
+        list(rdkit_mols), molsPerRow=grid_size[0], returnPNG=False)
     if save_path:
         img.save(save_path)
     else: